@@ -39,6 +39,17 @@ def _issue(level: str, message: str, *, role: str | None = None,
     }
 
 
+def _functions_by_pin(routes: dict[str, dict[str, list[str]]]) -> dict[str, list[str]]:
+    """{pin: ["periph:signal", …]} — the route table inverted once, so each bad
+    named pin's suggestions are a lookup rather than a scan of every route."""
+    out: dict[str, list[str]] = {}
+    for periph, sigs in routes.items():
+        for signal, pins in sigs.items():
+            for pin in pins:
+                out.setdefault(pin, []).append(f"{periph}:{signal}")
+    return out
+
+
 def _check_peripheral(role: str, cfg: dict[str, Any], spec, chip: dict[str, Any],
                       classes: dict[str, str | None]) -> tuple[str | None, list[dict[str, Any]]]:
     """Resolve the role's peripheral, reporting why it can't be used."""
@@ -181,6 +192,9 @@ def validate_board(board: dict[str, Any], chip: dict[str, Any],
     issues.extend(_check_external_clock(board, program))
 
     # --- roles -----------------------------------------------------------
+    # Pin ownership for the "claimed twice" check below is gathered in this same
+    # pass: it needs exactly the roles this loop already resolved.
+    owners: dict[str, list[str]] = {}
     for role, cfg in sorted(roles.items()):
         spec = ROLES.get(role)
         if spec is None:
@@ -193,6 +207,12 @@ def validate_board(board: dict[str, Any], chip: dict[str, Any],
                                  role=role))
             continue
 
+        claimed = [cfg.get(f) for f in role_pin_fields(spec)]
+        claimed += list(cfg.get(spec.pin_list_field) or []) if spec.pin_list_field else []
+        for pin in claimed:
+            if isinstance(pin, str):
+                owners.setdefault(pin, []).append(role)
+
         peripheral: str | None = None
         if spec.kind == "peripheral":
             peripheral, found = _check_peripheral(role, cfg, spec, chip, classes)
@@ -292,6 +312,7 @@ def validate_board(board: dict[str, Any], chip: dict[str, Any],
                     suggestions=[c.removeprefix("ch") for c in channels][:MAX_SUGGESTIONS]))
 
     # --- named pins (board.json "pins") -----------------------------------
+    by_pin: dict[str, list[str]] | None = None  # built on the first bad route
     for pin, assign in sorted((board.get("pins") or {}).items()):
         if pin not in pins:
             issues.append(_issue("error", f"named pin '{pin}' is not on this chip",
@@ -308,8 +329,9 @@ def validate_board(board: dict[str, Any], chip: dict[str, Any],
             continue
         periph, _, signal = function.partition(":")
         if pin not in routes.get(periph, {}).get(signal, []):
-            available = [f"{p}:{s}" for p, sigs in routes.items()
-                         for s, ps in sigs.items() if pin in ps]
+            if by_pin is None:
+                by_pin = _functions_by_pin(routes)
+            available = by_pin.get(pin, [])
             issues.append(_issue(
                 "error", f"pin {pin} has no route to {periph} {signal}",
                 field="pins", pin=pin,
@@ -319,16 +341,6 @@ def validate_board(board: dict[str, Any], chip: dict[str, Any],
     # NOT an error: a board may deliberately expose one LED as both a GPIO and a
     # PWM output (every shipped Nucleo does). Worth saying out loud, because the
     # app must then use one or the other.
-    owners: dict[str, list[str]] = {}
-    for role, cfg in roles.items():
-        spec = ROLES.get(role)
-        if spec is None or not isinstance(cfg, dict):
-            continue
-        claimed = [cfg.get(f) for f in role_pin_fields(spec)]
-        claimed += list(cfg.get(spec.pin_list_field) or []) if spec.pin_list_field else []
-        for pin in claimed:
-            if isinstance(pin, str):
-                owners.setdefault(pin, []).append(role)
     for pin, sharing in sorted(owners.items()):
         if len(sharing) > 1:
             issues.append(_issue(
@@ -7,8 +7,10 @@ copy for people who want to own their build.
 
 from __future__ import annotations
 
+import os
 import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -42,7 +44,11 @@ def _arch_ns(chip: dict[str, Any]) -> str:
     raise EmitError(f"unsupported architecture {arch}")
 
 
+@lru_cache(maxsize=1)
 def _xtensa_prefix() -> str:
+    # Asked up to four times per Xtensa build (toolchain file, dynconfig, size,
+    # and again by `alloy size`), and once per ESP32 row of a matrix sweep; the
+    # PATH walk only needs to happen once. A miss raises, so it is not cached.
     if found := shutil.which("xtensa-esp-elf-gcc"):
         return str(Path(found).with_name("xtensa-esp-elf-"))
     candidate = Path.home() / ".alloy/tools/xtensa-esp-elf/bin/xtensa-esp-elf-gcc"
@@ -220,9 +226,26 @@ target_link_options({project.name}.elf PRIVATE
 """
 
 
+def _user_sources(src: Path) -> list[Path]:
+    """Every .cpp then every .c under src/, each group sorted.
+
+    One os.walk instead of two rglob passes: the walk's readdir already hands
+    us the names, so a plain suffix check replaces the glob matcher and the
+    tree is only traversed once however many languages we collect.
+    """
+    cpp: list[Path] = []
+    c: list[Path] = []
+    for dirpath, _dirs, files in os.walk(src):
+        for name in files:
+            if name.endswith(".cpp"):
+                cpp.append(Path(dirpath, name))
+            elif name.endswith(".c"):
+                c.append(Path(dirpath, name))
+    return sorted(cpp) + sorted(c)
+
+
 def build(project: Project, chip: dict[str, Any]) -> Path:
-    sources = sorted((project.root / "src").rglob("*.cpp")) + \
-        sorted((project.root / "src").rglob("*.c"))
+    sources = _user_sources(project.root / "src")
     if not sources:
         raise EmitError(f"no sources under {project.root / 'src'}")
 
@@ -274,8 +297,6 @@ def build(project: Project, chip: dict[str, Any]) -> Path:
 
     env = None
     if _arch_ns(chip) == "xtensa":
-        import os  # noqa: PLC0415
-
         dynconfig = (Path(_xtensa_prefix()).parent.parent / "lib" /
                      f"xtensa_{chip['family']}.so")
         if not dynconfig.exists():
@@ -10,6 +10,7 @@ build whatever they want, without a curated board.
 from __future__ import annotations
 
 import json
+import os
 import re
 from pathlib import Path
 from typing import Any
@@ -17,8 +18,12 @@ from typing import Any
 from .emit.common import EmitError
 from .roles import ROLES, routes_by_peripheral
 
-_FAMILY = re.compile(r"^family:\s*(\S+)", re.M)
-_CORE = re.compile(r"name:\s*(cm0plus|cm0|cm3|cm4|cm7|cm33|lx6|lx7)\b")
+# Byte patterns: list_chips scans raw file bytes and decodes only the match.
+_FAMILY = re.compile(rb"^family:\s*(\S+)", re.M)
+_CORE = re.compile(rb"name:\s*(cm0plus|cm0|cm3|cm4|cm7|cm33|lx6|lx7)\b")
+# Both facts sit in the header of a chip file, ahead of the pin and route tables
+# that make up most of its bytes, so list_chips reads this much first.
+_HEAD_BYTES = 8192
 # Timer route signals are named ch1/ch2/… — a PWM role picks a CHANNEL, and the
 # pins it can drive come from that channel's routes.
 _CHANNEL_SIGNAL = re.compile(r"^ch(\d+)$")
@@ -31,34 +36,74 @@ def _chips_dir(devices_root: Path) -> Path:
     return d
 
 
-def list_chips(devices_root: Path) -> list[dict[str, Any]]:
+def list_chips(devices_root: Path, vendor: str | None = None) -> list[dict[str, Any]]:
     """Every chip as {id, vendor, chip, family, core} — cheap regex read (no full
-    YAML parse) so listing all ~400 stays fast."""
+    YAML parse) so listing all ~400 stays fast.
+
+    `vendor` narrows the walk to that vendor's directory, so `alloy chips
+    --vendor st` reads only st's files instead of all of them and discarding
+    most of the rows."""
     rows: list[dict[str, Any]] = []
-    for f in sorted(_chips_dir(devices_root).glob("*/*.yaml")):
-        text = f.read_text()
-        fam = _FAMILY.search(text)
-        core = _CORE.search(text)
+    for vendor_name, chip, path in _chip_files(_chips_dir(devices_root), vendor):
+        fam, core = _scan_head(path)
         rows.append({
-            "id": f"{f.parent.name}/{f.stem}",
-            "vendor": f.parent.name,
-            "chip": f.stem,
-            "family": fam.group(1) if fam else f.stem,
-            "core": core.group(1) if core else None,
+            "id": f"{vendor_name}/{chip}",
+            "vendor": vendor_name,
+            "chip": chip,
+            "family": fam.decode() if fam else chip,
+            "core": core.decode() if core else None,
         })
     return rows
 
 
+def _scan_head(path: str) -> tuple[bytes | None, bytes | None]:
+    """The family and core of one chip file, reading only its head when that
+    is enough and the whole file otherwise. Bytes throughout: nothing is
+    decoded except the two values found."""
+    with open(path, "rb") as fh:
+        data = fh.read(_HEAD_BYTES)
+        if len(data) == _HEAD_BYTES:
+            # Only whole lines count: a cut `name: cm33` must not match as cm3.
+            complete = data[: data.rfind(b"\n") + 1]
+            fam, core = _FAMILY.search(complete), _CORE.search(complete)
+            if fam and core:
+                return fam[1], core[1]
+            data += fh.read()
+    fam, core = _FAMILY.search(data), _CORE.search(data)
+    return (fam[1] if fam else None), (core[1] if core else None)
+
+
+def _chip_files(chips_dir: Path, vendor: str | None) -> list[tuple[str, str, str]]:
+    """(vendor, chip, path) for every chips/<vendor>/<chip>.yaml, sorted.
+
+    os.scandir rather than Path.glob: the directory entries already carry the
+    name and type, so there is no pattern matching, no Path object per file and
+    no extra stat to tell vendor directories from stray files."""
+    # `vendor` only ever selects one of the listed directories, never a path:
+    # "ST" on a case-insensitive disk or "../registers" must find no chips.
+    with os.scandir(chips_dir) as it:
+        vendors = [e.name for e in it
+                   if e.is_dir() and (vendor is None or e.name == vendor)]
+    found: list[tuple[str, str, str]] = []
+    for v in vendors:
+        with os.scandir(chips_dir / v) as it:
+            found += [(v, e.name, e.path) for e in it
+                      if e.name.endswith(".yaml") and e.is_file()]
+    # Sort on the file name, as sorting the glob's paths did, then drop ".yaml".
+    return [(v, name[:-5], path) for v, name, path in sorted(found)]
+
+
 def chip_clock(devices_root: Path, chip_id: str) -> tuple[list[str], str]:
     """(profile names, default) for a chip. Default = the first profile, which
     is the boot-safe (no-PLL) one by database convention."""
-    import yaml  # noqa: PLC0415
+    from .devices import load_chip  # noqa: PLC0415
 
-    vendor, _, name = chip_id.partition("/")
-    f = _chips_dir(devices_root) / vendor / f"{name}.yaml"
-    if not f.exists():
-        raise EmitError(f"unknown chip '{chip_id}' — try `alloy chips`")
-    data = yaml.safe_load(f.read_text())
+    # Called for its error only: a wrong devices root should say "no chips/
+    # under …", not blame the chip id as load_chip's "unknown chip" would.
+    _chips_dir(devices_root)
+    # The shared, cached C-loader read: chip_info and the board tools parse the
+    # same file, so one process never parses a chip twice.
+    data = load_chip(devices_root, chip_id)
     profiles = list((data.get("clock") or {}).get("profiles", {}).keys())
     if not profiles:
         raise EmitError(f"chip '{chip_id}' has no clock profiles in the database")
@@ -21,11 +21,7 @@ import subprocess
 import sys
 from pathlib import Path
 
-from alloy_devices.loader import load_database
-
 from . import __version__
-from .build import build
-from .emit import generate
 from .emit.common import EmitError
 from .project import Project, ProjectError, load_project
 
@@ -488,9 +484,7 @@ def cmd_chips(args: argparse.Namespace) -> int:
     from .project import _find_alloy_root, _find_devices_root  # noqa: PLC0415
 
     alloy_root = _find_alloy_root(Path.cwd())
-    rows = list_chips(_find_devices_root(alloy_root))
-    if args.vendor:
-        rows = [r for r in rows if r["vendor"] == args.vendor]
+    rows = list_chips(_find_devices_root(alloy_root), vendor=args.vendor)
     if getattr(args, "json", False):
         print(json.dumps({"schema": "alloy.chips.v1", "chips": rows}, indent=2))
         return 0
@@ -560,6 +554,8 @@ def _slot(args: argparse.Namespace) -> str | None:
 
 
 def cmd_gen(args: argparse.Namespace) -> int:
+    from .emit import generate  # noqa: PLC0415
+
     project = _project(args)
     written = generate(project, layout=_layout(args), slot=_slot(args))
     print(f"generated {len(written)} file(s) -> {project.gen_dir}")
@@ -567,6 +563,11 @@ def cmd_gen(args: argparse.Namespace) -> int:
 
 
 def cmd_build(args: argparse.Namespace) -> int:
+    from alloy_devices.loader import load_database  # noqa: PLC0415
+
+    from .build import build  # noqa: PLC0415
+    from .emit import generate  # noqa: PLC0415
+
     project = _project(args)
     db = load_database(project.devices_root)
     generate(project, db, layout=_layout(args), slot=_slot(args))
@@ -603,6 +604,10 @@ def cmd_build(args: argparse.Namespace) -> int:
 
 
 def cmd_flash(args: argparse.Namespace) -> int:
+    from alloy_devices.loader import load_database  # noqa: PLC0415
+
+    from .build import build  # noqa: PLC0415
+    from .emit import generate  # noqa: PLC0415
     from .flash import flash  # noqa: PLC0415
 
     project = _project(args)
@@ -796,9 +801,11 @@ def cmd_set_board(args: argparse.Namespace) -> int:
               file=sys.stderr)
         return 1
     text = toml_path.read_text()
+    # A callable replacement is spliced in verbatim: no template to parse per
+    # call, and nothing in the id can be read as a group reference or escape.
     new_text, n = re.subn(
         r'(\[board\]\s*\n\s*id\s*=\s*")[^"]*(")',
-        rf"\g<1>{args.board_id}\g<2>",
+        lambda m: f"{m.group(1)}{args.board_id}{m.group(2)}",
         text,
         count=1,
     )
@@ -821,6 +828,8 @@ def cmd_setup(args: argparse.Namespace) -> int:
 def cmd_debug_info(args: argparse.Namespace) -> int:
     import json  # noqa: PLC0415
 
+    from alloy_devices.loader import load_database  # noqa: PLC0415
+
     from .debug import debug_info  # noqa: PLC0415
 
     project = _project(args)
@@ -861,6 +870,10 @@ def _find_renode() -> str | None:
 
 
 def cmd_emulate(args: argparse.Namespace) -> int:
+    from alloy_devices.loader import load_database  # noqa: PLC0415
+
+    from .build import build  # noqa: PLC0415
+    from .emit import generate  # noqa: PLC0415
     from .emit.renode import (  # noqa: PLC0415
         debug_uart_name,
         emit_renode_platform,
@@ -178,7 +178,7 @@ def _same70_program(ws: int, m: int, n: int, _div: int, tok: Any,
     ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Divisor:
     value: int            # the overall division applied to the VCO
     token: Any            # what the program builder needs (e.g. (pd1, pd2) or a PRES field)
@@ -28,21 +28,25 @@ from .emit.common import EmitError
 
 
 def _read(path: Path) -> Any:
-    return yaml.load(path.read_text(), Loader=_Loader)
+    # Bytes straight to libyaml: it detects the encoding itself, so decoding to
+    # str first only to have the C loader re-encode it is wasted work.
+    return yaml.load(path.read_bytes(), Loader=_Loader)
 
 
 def chip_path(devices_root: Path, chip_id: str) -> Path:
-    """Path of a chip file, or a helpful error naming the verb that lists them."""
+    """Where a chip's file lives (whether or not it exists)."""
     vendor, _, part = chip_id.partition("/")
-    path = devices_root / "chips" / vendor / f"{part}.yaml"
-    if not path.exists():
-        raise EmitError(f"unknown chip '{chip_id}' — try `alloy chips`")
-    return path
+    return devices_root / "chips" / vendor / f"{part}.yaml"
 
 
 @lru_cache(maxsize=8)
 def load_chip(devices_root: Path, chip_id: str) -> dict[str, Any]:
-    return _read(chip_path(devices_root, chip_id))
+    """One chip's document, or a helpful error naming the verb that lists them.
+    Opening is the existence check — no separate stat first."""
+    try:
+        return _read(chip_path(devices_root, chip_id))
+    except (FileNotFoundError, NotADirectoryError):
+        raise EmitError(f"unknown chip '{chip_id}' — try `alloy chips`") from None
 
 
 @lru_cache(maxsize=2)
@@ -9,9 +9,6 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from alloy_devices.lints import run_all
-from alloy_devices.loader import load_database
-
 from ..project import Project
 from .board import emit_board_header, emit_board_source, flash_reserved_bytes
 from .common import EmitError, cpp_ip_namespace
@@ -39,6 +36,12 @@ def _write(path: Path, content: str, written: list[Path]) -> None:
 
 def generate(project: Project, db=None, layout: str = "flash",
              slot: str | None = None) -> list[Path]:
+    # The database loader and its linters (and jsonschema under them) load here,
+    # not with the package: every `from .emit.common import EmitError` in the
+    # CLI initialises this package, and most of those callers never generate.
+    from alloy_devices.lints import run_all  # noqa: PLC0415
+    from alloy_devices.loader import load_database  # noqa: PLC0415
+
     if db is None:
         db = load_database(project.devices_root)
     run_all(db)
@@ -19,6 +19,9 @@ from .common import (
     uses_external_clock,
 )
 
+# A named pin's label becomes a C++ identifier verbatim.
+_LABEL = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
 
 def _require(cond: bool, msg: str) -> None:
     if not cond:
@@ -664,12 +667,16 @@ def emit_board_header(board: dict[str, Any], chip: dict[str, Any],
     # error naming the pin, same spirit as guard #7) and emits the pin-type alias
     # for use in explicit bind<>s.
     pin_decls: list[str] = []
+    # (pin, peripheral, signal) for every route, built on the first
+    # alternate-function pin so each check is one set lookup, not a scan of
+    # the chip's full AF matrix.
+    routed: set[tuple[Any, Any, Any]] | None = None
     for pin, assign in sorted((board.get("pins") or {}).items()):
         _require(pin in chip.get("pins", {}),
                  f"board {board['id']}: named pin '{pin}' not in chip data")
         fn = assign.get("function", "")
         label = assign.get("label")
-        if label is not None and not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", label):
+        if label is not None and not _LABEL.fullmatch(label):
             raise EmitError(f"board {board['id']}: pin '{pin}' label '{label}' is "
                             f"not a valid identifier")
         if fn in ("gpio_out", "gpio_in"):
@@ -680,9 +687,10 @@ def emit_board_header(board: dict[str, Any], chip: dict[str, Any],
                     f"alloy::gpio::active_high_t> {label}{{}};  // {pin}")
         elif ":" in fn:
             periph, _, signal = fn.partition(":")
-            routes = chip.get("routes") or []
-            _require(any(r.get("pin") == pin and r.get("peripheral") == periph
-                         and r.get("signal") == signal for r in routes),
+            if routed is None:
+                routed = {(r.get("pin"), r.get("peripheral"), r.get("signal"))
+                          for r in chip.get("routes") or []}
+            _require((pin, periph, signal) in routed,
                      f"board {board['id']}: pin '{pin}' has no route to "
                      f"{periph} {signal} on this chip")
             if label:
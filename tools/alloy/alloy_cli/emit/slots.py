@@ -54,7 +54,7 @@ _BOOTLOADER_BYTES = 32 * 1024
 _STORE_PAGES = 2
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Region:
     base: int
     size: int
@@ -15,6 +15,7 @@ import struct
 import subprocess
 import sys
 import time
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -24,6 +25,17 @@ from .emit.common import EmitError
 from .ports import find_serial_port  # noqa: F401  (re-export: monitor/esptool path)
 
 
+@cache
+def _which(tool: str) -> str | None:
+    """shutil.which, once per tool per process.
+
+    Runner selection asks for the same handful of tools several times (probe
+    first, then the runner re-checks), and each ask is a stat per PATH entry.
+    After installing a tool mid-process, `_which.cache_clear()` re-scans.
+    """
+    return shutil.which(tool)
+
+
 def flash(board: dict[str, Any], chip: dict[str, Any], elf: Path,
           ram: bool = False) -> str:
     probe = board.get("probe")
@@ -46,14 +58,11 @@ def flash(board: dict[str, Any], chip: dict[str, Any], elf: Path,
     if declared == "esptool":
         return _flash_esptool(elf, probe)
 
-    if shutil.which("probe-rs") and "chip_id" in probe:
+    if _which("probe-rs") and "chip_id" in probe:
         return _flash_probe_rs(elf, probe)
 
-    if shutil.which("openocd"):
-        interface = _OPENOCD_INTERFACE.get(probe.get("kind", ""))
-        target = _OPENOCD_TARGET.get(chip["family"])
-        if interface and target:
-            return _flash_openocd(board, chip, elf, probe)
+    if _which("openocd") and _openocd_base(chip, probe):
+        return _flash_openocd(board, chip, elf, probe)
 
     if probe.get("kind") == "bootsel":
         return _flash_uf2(chip, elf, probe)
@@ -61,10 +70,10 @@ def flash(board: dict[str, Any], chip: dict[str, Any], elf: Path,
     if probe.get("kind") == "esptool":
         return _flash_esptool(elf, probe)
 
-    if shutil.which("st-flash") and probe.get("kind") == "stlink":
+    if _which("st-flash") and probe.get("kind") == "stlink":
         flash_base = next(m["base"] for m in chip["memories"] if m["kind"] == "flash")
         bin_path = elf.with_suffix(".bin")
-        objcopy = shutil.which("arm-none-eabi-objcopy")
+        objcopy = _which("arm-none-eabi-objcopy")
         if objcopy is None:
             raise EmitError("st-flash fallback needs arm-none-eabi-objcopy on PATH")
         subprocess.run([objcopy, "-O", "binary", str(elf), str(bin_path)], check=True)
@@ -77,7 +86,7 @@ def flash(board: dict[str, Any], chip: dict[str, Any], elf: Path,
 
 
 def _flash_probe_rs(elf: Path, probe: dict[str, Any]) -> str:
-    if not shutil.which("probe-rs"):
+    if not _which("probe-rs"):
         raise EmitError("probe-rs declared/needed but not on PATH")
     subprocess.run(
         ["probe-rs", "download", "--chip", probe["chip_id"], str(elf)], check=True
@@ -86,21 +95,32 @@ def _flash_probe_rs(elf: Path, probe: dict[str, Any]) -> str:
     return "probe-rs"
 
 
-def _flash_openocd(board: dict[str, Any], chip: dict[str, Any], elf: Path,
-                   probe: dict[str, Any]) -> str:
-    if not shutil.which("openocd"):
-        raise EmitError("openocd declared/needed but not on PATH (alloy setup)")
+def _openocd_base(chip: dict[str, Any], probe: dict[str, Any]) -> tuple[str, ...] | None:
+    """`openocd -f interface/… -f target/…` for this probe and chip family, or
+    None when either has no mapping — the one place the runner probe, the flash
+    runner and the RAM loader get their openocd command from."""
     interface = _OPENOCD_INTERFACE.get(probe.get("kind", ""))
     target = _OPENOCD_TARGET.get(chip["family"])
     if not (interface and target):
+        return None
+    return ("openocd", "-f", f"interface/{interface}.cfg", "-f", f"target/{target}.cfg")
+
+
+def _openocd_cmd(chip: dict[str, Any], probe: dict[str, Any]) -> tuple[str, ...]:
+    base = _openocd_base(chip, probe)
+    if base is None:
         raise EmitError(
             f"no openocd mapping for probe '{probe.get('kind')}' / family '{chip['family']}'"
         )
+    return base
+
+
+def _flash_openocd(board: dict[str, Any], chip: dict[str, Any], elf: Path,
+                   probe: dict[str, Any]) -> str:
+    if not _which("openocd"):
+        raise EmitError("openocd declared/needed but not on PATH (alloy setup)")
     subprocess.run(
-        ["openocd",
-         "-f", f"interface/{interface}.cfg",
-         "-f", f"target/{target}.cfg",
-         "-c", f"program {{{elf}}} verify reset exit"],
+        [*_openocd_cmd(chip, probe), "-c", f"program {{{elf}}} verify reset exit"],
         check=True,
     )
     return "openocd"
@@ -111,33 +131,29 @@ def _flash_openocd_ram(chip: dict[str, Any], elf: Path, probe: dict[str, Any]) -
     The whole program (vectors, text, data) lives in RAM; we load it, then set
     SP/PC from the vector table the linker placed at the RAM base and resume.
     A reset is deliberately NOT issued — it would wipe the RAM we just loaded."""
-    if not shutil.which("openocd"):
+    if not _which("openocd"):
         raise EmitError("run-from-RAM needs openocd on PATH (probe-rs RAM load not wired)")
-    interface = _OPENOCD_INTERFACE.get(probe.get("kind", ""))
-    target = _OPENOCD_TARGET.get(chip["family"])
-    if not (interface and target):
-        raise EmitError(
-            f"no openocd mapping for probe '{probe.get('kind')}' / family '{chip['family']}'"
-        )
+    base = _openocd_cmd(chip, probe)
     ram_base = int(next(m["base"] for m in chip["memories"] if m["kind"] == "ram"), 16)
     script = (
         # `mrw` is a proc from mem_helper.tcl; the STM32 target cfgs source it but
         # e.g. atsamv.cfg (same70) does not, so pull it in explicitly.
-        f"source [find mem_helper.tcl]; "
-        f"init; halt; "
-        f"load_image {{{elf}}}; "
-        f"set sp [mrw {ram_base}]; "
-        f"set pc [mrw {ram_base + 4}]; "
-        f"reg sp $sp; reg pc [expr {{$pc & -2}}]; "
-        f"resume; shutdown"
-    )
-    subprocess.run(
-        ["openocd",
-         "-f", f"interface/{interface}.cfg",
-         "-f", f"target/{target}.cfg",
-         "-c", script],
-        check=True,
+        "source [find mem_helper.tcl]\n"
+        "init\n"
+        "halt\n"
+        f"load_image {{{elf}}}\n"
+        f"set sp [mrw {ram_base}]\n"
+        f"set pc [mrw {ram_base + 4}]\n"
+        "reg sp $sp\n"
+        "reg pc [expr {$pc & -2}]\n"
+        "resume\n"
+        "shutdown\n"
     )
+    # A script file beside the ELF rather than one long `-c`: no argv length or
+    # quoting limits on a deep build path, and it can be rerun by hand.
+    cfg = elf.with_suffix(".ram.cfg")
+    cfg.write_text(script)
+    subprocess.run([*base, "-f", str(cfg)], check=True)
     return "openocd (RAM)"
 
 
@@ -151,7 +167,7 @@ _UF2_FLAG_FAMILY_ID = 0x00002000  # contract-ok: UF2 header flag
 
 def _elf_to_uf2(elf: Path, flash_base: int, family_id: int) -> bytes:
     """Flatten the ELF to a binary and encode it as UF2 (256B payload/block)."""
-    objcopy = shutil.which("arm-none-eabi-objcopy")
+    objcopy = _which("arm-none-eabi-objcopy")
     if objcopy is None:
         raise EmitError("UF2 conversion needs arm-none-eabi-objcopy on PATH")
     bin_path = elf.with_suffix(".bin")
@@ -288,7 +304,7 @@ def _generate_partition_table(partitions: list[list[Any]], out_bin: Path) -> Non
 
 
 def _flash_esptool(elf: Path, probe: dict[str, Any]) -> str:
-    esptool = shutil.which("esptool") or shutil.which("esptool.py")
+    esptool = _which("esptool") or _which("esptool.py")
     if esptool is None:
         raise EmitError("esptool not found on PATH (pip install esptool)")
     chip_id = probe["chip_id"]
@@ -28,6 +28,10 @@ def _frames_from_dwarf(text: str) -> list[tuple[str, int]]:
     """Extract (mangled_frame_name, byte_size) for every DW_TAG_structure_type
     whose name ends in '.Frame' (the coroutine frame types GCC/Clang emit)."""
     frames: list[tuple[str, int]] = []
+    # An ELF with no alloy::async tasks has no frame types at all; one
+    # substring scan says so without splitting or walking a single line.
+    if ".Frame" not in text:
+        return frames
     in_struct = False
     name: str | None = None
     size: int | None = None
@@ -39,17 +43,22 @@ def _frames_from_dwarf(text: str) -> list[tuple[str, int]]:
         name = None
         size = None
 
+    # A full ELF's DWARF runs to hundreds of thousands of lines and only a few
+    # shapes matter, so a substring test gates every regex: most lines never
+    # reach the regex engine.
     for line in text.splitlines():
-        die = _DIE.match(line)
-        if die:
-            flush()
-            in_struct = die.group(1) == "DW_TAG_structure_type"
+        if "Abbrev" in line:
+            die = _DIE.match(line)
+            if die:
+                flush()
+                in_struct = die.group(1) == "DW_TAG_structure_type"
+                continue
+        if not in_struct:
             continue
-        if in_struct:
-            if m := _NAME.search(line):
-                name = m.group(1)
-            if m := _SIZE.search(line):
-                size = int(m.group(1))
+        if "DW_AT_name" in line and (m := _NAME.search(line)):
+            name = m.group(1)
+        if "DW_AT_byte_size" in line and (m := _SIZE.search(line)):
+            size = int(m.group(1))
     flush()
     return frames
 
@@ -75,7 +84,10 @@ def audit_elf(elf: Path, objdump: str, cppfilt: str | None) -> list[dict[str, An
         raise ProjectError(f"no ELF at {elf} — build the project first (alloy build)")
     if not shutil.which(objdump) and not Path(objdump).exists():
         raise ProjectError(f"objdump '{objdump}' not found — pass --objdump or add the toolchain to PATH")
-    dwarf = subprocess.run([objdump, "--dwarf=info", str(elf)], capture_output=True, text=True)
+    # Only stdout is parsed; objdump's warnings go nowhere rather than being
+    # buffered and decoded for nothing.
+    dwarf = subprocess.run([objdump, "--dwarf=info", str(elf)], stdout=subprocess.PIPE,
+                           stderr=subprocess.DEVNULL, text=True)
     rows: list[dict[str, Any]] = []
     for mangled, size in _frames_from_dwarf(dwarf.stdout):
         decl = _DECL_N.search(mangled)
@@ -140,7 +140,7 @@ class Link(Protocol):
     def write(self, data: bytes) -> int: ...
 
 
-@dataclass
+@dataclass(slots=True)
 class Frame:
     ftype: int
     seq: int
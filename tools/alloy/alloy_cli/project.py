@@ -21,6 +21,15 @@ class ProjectError(RuntimeError):
     pass
 
 
+def _read_toml(path: Path) -> dict[str, Any] | None:
+    """A TOML file's table, or None when the file is absent — one open where
+    exists()-then-read paid a stat and an open for every optional file."""
+    try:
+        return tomllib.loads(path.read_text())
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
 @dataclass(frozen=True)
 class Project:
     root: Path
@@ -74,10 +83,9 @@ class Project:
         duplicating it into every example directory. Entries found in neither
         place are skipped (a stale toml never breaks the build).
         """
-        toml_path = self.root / "alloy.toml"
-        if not toml_path.exists():
+        data = _read_toml(self.root / "alloy.toml")
+        if data is None:
             return []
-        data = tomllib.loads(toml_path.read_text())
         out: list[Path] = []
         for name in data.get("libs", {}):
             for base in (self.root / "libs" / name, self.alloy_root / "libs" / name):
@@ -98,9 +106,9 @@ class Project:
         if not base.is_dir():
             return []
         dirs = ["include"]
-        manifest = base / "alloy.lib.toml"
-        if manifest.exists():
-            headers = tomllib.loads(manifest.read_text()).get("headers", {})
+        manifest = _read_toml(base / "alloy.lib.toml")
+        if manifest is not None:
+            headers = manifest.get("headers", {})
             declared = headers.get("include", dirs)
             if isinstance(declared, list) and declared:
                 dirs = [str(d) for d in declared]
@@ -111,10 +119,7 @@ class Project:
         an `alloy keygen` .pub, or 64 hex chars inline) turns on signed-image
         verification: codegen bakes the key into alloy/ota_key.hpp and the build
         pulls in the Ed25519 verifier. Absent -> integrity-only v1 behaviour."""
-        toml_path = self.root / "alloy.toml"
-        if not toml_path.exists():
-            return {}
-        return tomllib.loads(toml_path.read_text()).get("ota", {})
+        return (_read_toml(self.root / "alloy.toml") or {}).get("ota", {})
 
     def net_options(self) -> dict[str, Any]:
         """The optional ``[net]`` table from alloy.toml (lwIP feature/pool policy).
@@ -124,10 +129,7 @@ class Project:
         generator falls back to defaults that match the v1 hand-written config, so
         a project that never mentions [net] is byte-for-byte unchanged.
         """
-        toml_path = self.root / "alloy.toml"
-        if not toml_path.exists():
-            return {}
-        return tomllib.loads(toml_path.read_text()).get("net", {})
+        return (_read_toml(self.root / "alloy.toml") or {}).get("net", {})
 
     def load_board(self) -> dict[str, Any]:
         if not self.board_json.exists():
@@ -207,10 +209,9 @@ def read_project_settings(project_root: Path | None) -> dict[str, Any]:
     """`[roles.*]` and `[clock]` from a project's alloy.toml, or nothing."""
     if project_root is None:
         return {}
-    toml_path = project_root / "alloy.toml"
-    if not toml_path.exists():
+    data = _read_toml(project_root / "alloy.toml")
+    if data is None:
         return {}
-    data = tomllib.loads(toml_path.read_text())
     return {"roles": data.get("roles", {}), "clock": data.get("clock", {})}
 
 
@@ -264,9 +265,9 @@ def load_project(project_dir: Path, board_override: str | None = None,
                  product_override: str | None = None) -> Project:
     root = project_dir.resolve()
     toml_path = root / "alloy.toml"
-    if not toml_path.exists():
+    data = _read_toml(toml_path)
+    if data is None:
         raise ProjectError(f"{root} is not an alloy project (no alloy.toml)")
-    data = tomllib.loads(toml_path.read_text())
     try:
         name = data["project"]["name"]
         board_id = board_override or data["board"]["id"]
@@ -16,7 +16,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoleSpec:
     #: How the role is chosen: a peripheral instance, a bare pin, a list of
     #: pins, or a part on a bus that the chip knows nothing about.
@@ -123,15 +123,16 @@ def size_report(project: Project, chip: dict[str, Any],
     sections: dict[str, int] | None = None
     reason: str | None = None
 
-    if not elf.exists():
+    built = elf.exists()  # asked once; the envelope's "elf" reuses the answer
+    if not built:
         reason = f"no build yet for board '{project.board_id}' — run `alloy build`"
     else:
         tool = size_tool(chip)
         if tool is None:
             reason = "the toolchain's `size` is not on PATH — run `alloy setup`"
         else:
-            result = subprocess.run([tool, str(elf)], capture_output=True, text=True,
-                                    check=False)
+            result = subprocess.run([tool, str(elf)], stdout=subprocess.PIPE,
+                                    stderr=subprocess.DEVNULL, text=True, check=False)
             sections = parse_size(result.stdout)
             if sections is None:
                 reason = f"could not parse `{Path(tool).name}` output for {elf.name}"
@@ -140,7 +141,7 @@ def size_report(project: Project, chip: dict[str, Any],
         "schema": "alloy.size.v1",
         "board": project.board_id,
         "chip": chip.get("part"),
-        "elf": str(elf) if elf.exists() else None,
+        "elf": str(elf) if built else None,
         "available": sections is not None,
         "reason": reason,
         "sections": sections,
@@ -29,6 +29,33 @@ def test_list_chips_finds_hundreds_across_vendors() -> None:
         assert set(r) >= {"id", "vendor", "chip", "family"}
 
 
+def test_list_chips_vendor_reads_only_that_vendor(tmp_path: Path) -> None:
+    for vendor, part in (("st", "stm32g071rb"), ("nxp", "lpc1768")):
+        (tmp_path / "chips" / vendor).mkdir(parents=True)
+        (tmp_path / "chips" / vendor / f"{part}.yaml").write_text(
+            "family: f\ncores:\n  - name: cm0plus\n")
+    rows = chips.list_chips(tmp_path, vendor="st")
+    assert [r["id"] for r in rows] == ["st/stm32g071rb"]
+    assert rows[0]["core"] == "cm0plus"
+    assert chips.list_chips(tmp_path, vendor="nope") == []
+    # Only an exact directory name selects a vendor — never a path.
+    (tmp_path / "registers").mkdir()
+    (tmp_path / "registers" / "gpio.yaml").write_text("family: f\n")
+    assert chips.list_chips(tmp_path, vendor="ST") == []
+    assert chips.list_chips(tmp_path, vendor="../registers") == []
+    assert len(chips.list_chips(tmp_path)) == 2
+
+
+def test_list_chips_never_matches_a_token_cut_by_the_head_read(tmp_path: Path) -> None:
+    """Only the head of a chip file is scanned when it holds both facts; a core
+    name split across that boundary must come from the full read, whole."""
+    (tmp_path / "chips" / "st").mkdir(parents=True)
+    pad = "#" * (chips._HEAD_BYTES - len("family: f\n") - len("  - name: cm3"))
+    (tmp_path / "chips" / "st" / "cut.yaml").write_text(
+        f"family: f\n{pad}  - name: cm33\npins: {{}}\n")
+    assert chips.list_chips(tmp_path)[0]["core"] == "cm33"
+
+
 @skip_no_devices
 def test_chip_clock_returns_profiles_and_safe_default() -> None:
     profiles, default = chips.chip_clock(DEVICES_ROOT, "st/stm32g071rb")
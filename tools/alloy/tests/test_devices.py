@@ -0,0 +1,32 @@
+"""Unit tests for the light device-database loaders."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from alloy_cli.devices import load_chip
+from alloy_cli.emit.common import EmitError
+
+
+def _devices(tmp_path: Path) -> Path:
+    (tmp_path / "chips" / "st").mkdir(parents=True)
+    (tmp_path / "chips" / "st" / "stm32g071rb.yaml").write_text("family: stm32g0\n")
+    return tmp_path
+
+
+def test_load_chip_reads_the_chip_document(tmp_path: Path) -> None:
+    assert load_chip(_devices(tmp_path), "st/stm32g071rb") == {"family": "stm32g0"}
+
+
+def test_an_absent_chip_is_an_unknown_chip(tmp_path: Path) -> None:
+    with pytest.raises(EmitError, match="unknown chip 'st/nope'"):
+        load_chip(_devices(tmp_path), "st/nope")
+
+
+def test_a_chip_id_running_through_a_file_is_an_unknown_chip(tmp_path: Path) -> None:
+    # chips/st/stm32g071rb.yaml is a file, so the path beneath it is
+    # NotADirectoryError, not FileNotFoundError — still just "unknown chip".
+    with pytest.raises(EmitError, match="unknown chip"):
+        load_chip(_devices(tmp_path), "st/stm32g071rb.yaml/x")
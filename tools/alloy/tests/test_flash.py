@@ -0,0 +1,43 @@
+"""Unit tests for the flash runners' command lines (no probe attached: the
+subprocess call is captured, not run)."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+from alloy_cli import flash
+
+_CHIP = {"family": "stm32g0", "memories": [{"kind": "ram", "base": "0x20000000"}]}
+_BOARD = {"id": "b", "probe": {"kind": "stlink"}}
+
+
+def test_ram_load_runs_openocd_with_a_script_beside_the_elf(tmp_path: Path, monkeypatch) -> None:
+    calls: list[list[str]] = []
+    monkeypatch.setattr(flash, "_which", lambda tool: f"/usr/bin/{tool}")
+    monkeypatch.setattr(subprocess, "run", lambda cmd, **_kw: calls.append(cmd))
+    elf = tmp_path / "app.elf"
+
+    assert flash.flash(_BOARD, _CHIP, elf, ram=True) == "openocd (RAM)"
+
+    cfg = tmp_path / "app.ram.cfg"
+    assert calls == [["openocd", "-f", "interface/stlink.cfg",
+                      "-f", "target/stm32g0x.cfg", "-f", str(cfg)]]
+    script = cfg.read_text().splitlines()
+    assert script[:3] == ["source [find mem_helper.tcl]", "init", "halt"]
+    assert f"load_image {{{elf}}}" in script
+    # SP and PC come from the vector table at the RAM base; no reset.
+    assert f"set sp [mrw {0x20000000}]" in script
+    assert f"set pc [mrw {0x20000004}]" in script
+    assert script[-2:] == ["resume", "shutdown"]
+    assert not any("reset" in line for line in script)
+
+
+def test_ram_load_rewrites_a_stale_script(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(flash, "_which", lambda tool: f"/usr/bin/{tool}")
+    monkeypatch.setattr(subprocess, "run", lambda cmd, **_kw: None)
+    (tmp_path / "app.ram.cfg").write_text("left over from another build\n")
+
+    flash.flash(_BOARD, _CHIP, tmp_path / "app.elf", ram=True)
+
+    assert (tmp_path / "app.ram.cfg").read_text().startswith("source [find mem_helper.tcl]\n")
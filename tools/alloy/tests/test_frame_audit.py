@@ -36,6 +36,18 @@ def test_parses_only_frame_structs() -> None:
     assert sizes[blink] == 72
 
 
+def test_only_the_indirect_string_name_form_is_read() -> None:
+    # The name is the token after a SECOND colon (`: (indirect string, …): x`);
+    # a one-colon inline form does not name a frame.
+    inline = """\
+ <2><600>: Abbrev Number: 24 (DW_TAG_structure_type)
+    <601>   DW_AT_name        : inline.Frame
+    <605>   DW_AT_byte_size   : 32
+"""
+    assert frame_audit._frames_from_dwarf(inline) == []
+    assert len(frame_audit._frames_from_dwarf(_DWARF + inline)) == 2
+
+
 def test_declared_n_extracted_from_mangled_name() -> None:
     m = frame_audit._DECL_N.search("_ZN...task_storageILj256EEE.Frame")
     assert m and int(m.group(1)) == 256
@@ -49,3 +61,10 @@ def test_suggest_n_gives_rounded_headroom() -> None:
 
 def test_no_frames_is_empty_not_error() -> None:
     assert frame_audit._frames_from_dwarf("nothing here\n") == []
+
+
+def test_dwarf_without_frame_types_is_empty() -> None:
+    # Structs are present but none is a coroutine frame: the early exit must
+    # agree with the full walk.
+    plain = "\n".join(ln for ln in _DWARF.splitlines() if ".Frame" not in ln)
+    assert frame_audit._frames_from_dwarf(plain) == []
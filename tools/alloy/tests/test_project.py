@@ -0,0 +1,37 @@
+"""Unit tests for reading alloy.toml: an absent file is "not a project",
+never a traceback — the verbs that fall back on ProjectError depend on it."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from alloy_cli.project import ProjectError, _read_toml, load_project
+
+
+def test_read_toml_of_an_absent_file_is_none(tmp_path: Path) -> None:
+    assert _read_toml(tmp_path / "alloy.toml") is None
+
+
+def test_read_toml_beneath_a_regular_file_is_none(tmp_path: Path) -> None:
+    # e.g. --project ./alloy.toml: the path looked up is alloy.toml/alloy.toml.
+    (tmp_path / "alloy.toml").write_text("")
+    assert _read_toml(tmp_path / "alloy.toml" / "alloy.toml") is None
+
+
+def test_read_toml_parses_a_present_file(tmp_path: Path) -> None:
+    (tmp_path / "alloy.toml").write_text('[project]\nname = "p"\n')
+    assert _read_toml(tmp_path / "alloy.toml") == {"project": {"name": "p"}}
+
+
+def test_a_directory_without_alloy_toml_is_not_a_project(tmp_path: Path) -> None:
+    with pytest.raises(ProjectError, match="not an alloy project"):
+        load_project(tmp_path)
+
+
+def test_a_file_given_as_the_project_is_not_a_project(tmp_path: Path) -> None:
+    toml = tmp_path / "alloy.toml"
+    toml.write_text('[project]\nname = "p"\n')
+    with pytest.raises(ProjectError, match="not an alloy project"):
+        load_project(toml)